@@ -1,13 +1,9 @@
 #!/usr/bin/env python3
-from time import sleep
-
 import click
 
-from util.constants import COMMON_CONTEXT, LOG
-from subcommands.files import organize_files, concat_files, autoname_files
-from subcommands.tags import set_tags, print_tags, verify_tags
-from util.file import CWD
+from util.constants import COMMON_CONTEXT
 from util.decorators import common_logging
+from util.lazy_group import LazyGroup
 
 
 @click.group(context_settings=COMMON_CONTEXT)
@@ -17,30 +13,37 @@ def cli():
     pass
 
 
-@cli.group(context_settings=COMMON_CONTEXT)
+# Subcommand modules are imported lazily so invoking one command never pays
+# the import cost of the others (mutagen, subprocess machinery, etc.).
+@cli.group(
+    cls=LazyGroup,
+    context_settings=COMMON_CONTEXT,
+    lazy_subcommands={
+        "print": "subcommands.tags:print_tags",
+        "set": "subcommands.tags:set_tags",
+        "verify": "subcommands.tags:verify_tags",
+    },
+)
 @common_logging
 def tags():
     """Commands for editing audiobook tags."""
     pass
 
 
-# tags subcommands
-tags.add_command(print_tags)
-tags.add_command(set_tags)
-tags.add_command(verify_tags)
-
-
-@cli.group(context_settings=COMMON_CONTEXT)
+@cli.group(
+    cls=LazyGroup,
+    context_settings=COMMON_CONTEXT,
+    lazy_subcommands={
+        "organize": "subcommands.files:organize_files",
+        "concat": "subcommands.files:concat_files",
+        "autoname": "subcommands.files:autoname_files",
+    },
+)
 @common_logging
 def files():
     """Commands for working with audio files."""
     pass
 
 
-# files subcommands
-files.add_command(organize_files)
-files.add_command(concat_files)
-files.add_command(autoname_files)
-
 if __name__ == "__main__":
     cli()
@@ -1,11 +1,14 @@
+import json
 import os
 import re
 import shlex
 import shutil
 import subprocess
-from typing import Any
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 
 import click
+from mutagen import File as MutagenFile
 from mutagen.mp4 import MP4
 
 from util.constants import (
@@ -15,8 +18,26 @@ from util.constants import (
     TAG_DELIMITER,
 )
 from util.decorators import common_logging, common_options
-from util.file import CWD, get_file_list, filter_path_name
-from util.mp4 import GENRES, Tag, pprint_tags
+from util.file import get_file_list, filter_path_name, prefetch_headers
+from util.mp4 import GENRES, Tag, open_mp4, pprint_tags
+
+# Chapter filename pattern: leading number, title, extension. Compiled once
+# at import so the hot probe loop reuses the pattern object directly.
+# _CH_PATTERN: re.Pattern = re.compile(r"[^\d]*(\d+)\....$")
+_CH_PATTERN: re.Pattern = re.compile(r"^(\d+)(.+)\.[^\.]+$")
+
+
+# Chapters are plain tuples: a fraction of the footprint of per-chapter
+# dicts, with field access by offset instead of key hashing.
+_Chapter = namedtuple("_Chapter", "start end duration title")
+
+
+def _chapter_sort_key(name: str) -> tuple[int, int, str]:
+    """Sort chapter files by numeric prefix so '2 ...' precedes '10 ...'."""
+    m = _CH_PATTERN.match(name)
+    # names without a leading number sort after numbered ones; the metadata
+    # step reports them with a proper error
+    return (0, int(m[1]), name) if m else (1, 0, name)
 
 
 # move all files in source directory and subdirectories to a new directory
@@ -27,7 +48,7 @@ from util.mp4 import GENRES, Tag, pprint_tags
 @click.option(
     "--destination",
     "-d",
-    default=CWD,
+    default=lambda: os.getcwd(),
     show_default=False,
     help="Destination directory to organize files to. Defaults to current directory.",
 )
@@ -55,6 +76,14 @@ from util.mp4 import GENRES, Tag, pprint_tags
     show_default=True,
     help="File permissions mode to enforce.",
 )
+@click.option(
+    "--jobs",
+    "-j",
+    default=1,
+    show_default=True,
+    type=int,
+    help="Number of files to move in parallel.",
+)
 @common_logging
 @common_options
 def organize_files(
@@ -64,6 +93,7 @@ def organize_files(
     perms: bool,
     dir_mode: str,
     file_mode: str,
+    jobs: int,
     recurse: bool,
 ):
     """
@@ -74,175 +104,294 @@ def organize_files(
     the subfolder.
     """
 
-    def str_to_mode(mode: str) -> int:
-        # mode value is hexadecimal
-        return int(mode, 8)
+    LOG.debug("Source: '%s'", source)
+    LOG.debug("Destination: '%s'", destination)
+    LOG.debug("Prune: '%s'", prune)
+    LOG.debug("Manage Permissions: '%s'", perms)
+    LOG.debug("Dir mode: '%s'", dir_mode)
+    LOG.debug("File mode: '%s'", file_mode)
 
-    LOG.debug(f"Source: '{source}'")
-    LOG.debug(f"Destination: '{destination}'")
-    LOG.debug(f"Prune: '{prune}'")
-    LOG.debug(f"Manage Permissions: '{perms}'")
-    LOG.debug(f"Dir mode: '{dir_mode}'")
-    LOG.debug(f"File mode: '{file_mode}'")
-
-    dir_mode_int: int = str_to_mode(dir_mode)
-    LOG.debug(f"Calculated dir mode: '{dir_mode_int}'")
-    file_mode_int: int = str_to_mode(file_mode)
-    LOG.debug(f"Calculated file mode: '{file_mode_int}'")
+    # mode strings are octal
+    dir_mode_int: int = int(dir_mode, 8)
+    LOG.debug("Calculated dir mode: '%s'", dir_mode_int)
+    file_mode_int: int = int(file_mode, 8)
+    LOG.debug("Calculated file mode: '%s'", file_mode_int)
 
     # create destination directory if it does not exist
-    try:
-        os.mkdir(destination)
-    except FileExistsError:
-        # This is fine, continue
-        pass
-    if perms: 
+    os.makedirs(destination, exist_ok=True)
+    if perms:
         os.chmod(destination, dir_mode_int)
 
-    # pattern to match
-    pattern: re.Pattern = re.compile(r"^([^-]*) - (.*).m4b$")
+    # On POSIX a path join is just concatenation with a separator; skip
+    # os.path.join's per-part normalization on the hot path. Windows keeps
+    # os.path.join for drive-letter handling.
+    if os.name == "posix":
 
-    # dirs to prune after
-    prune_list: list[str] = []
+        def join_path(base: str, name: str) -> str:
+            return f"{base}{os.sep}{name}"
 
-    # os walk through current dir and all subdirectories
-    files: list[str] = get_file_list(source, "m4b", recurse)
-    if len(files) == 0:
-        LOG.error(f"No files found in '{source}'.")
+    else:
+        join_path = os.path.join
+
+    # dirs to prune after; a set so dedupe is O(1) per file
+    prune_dirs: set[str] = set()
+
+    # (old path, new path) moves to execute once planning is done
+    move_plan: list[tuple[str, str]] = []
+
+    # destinations already claimed by a queued move; duplicates are resolved
+    # here while planning is single-threaded, because pool workers racing the
+    # same destination can both pass move_file's existence check
+    planned_dests: set[str] = set()
+
+    # device id per destination directory, so each dir is only stat'd once
+    dest_dev_cache: dict[str, int] = {}
+
+    # directories already created and chmod'd this run; every file in a series
+    # shares the same author/title dirs, so only the first one pays syscalls
+    prepared_dirs: set[str] = set()
+
+    def ensure_dirs(author_dir: str, title_dir: str) -> None:
+        if title_dir in prepared_dirs:
+            return
+        # One call creates both levels and swallows the already-exists case.
+        # mode only applies to dirs actually created (and is umask-filtered),
+        # so the explicit chmod below still runs when managing permissions.
+        os.makedirs(
+            title_dir, mode=dir_mode_int if perms else 0o777, exist_ok=True
+        )
+        if perms:
+            os.chmod(author_dir, dir_mode_int)
+            os.chmod(title_dir, dir_mode_int)
+        prepared_dirs.add(title_dir)
+
+    def move_file(paths: tuple[str, str]) -> None:
+        old_file_path, new_file_path = paths
+        LOG.info(
+            f"Moving file '{old_file_path}' to '{new_file_path}'. This may take a while...."
+        )
+        # use shutil.copy because we don't really care about keeping metadata
+        # that shutil.copy2 would keep, and it can cause unnecessary issues on
+        # some filesystems
+        try:
+            if os.path.isfile(new_file_path):
+                LOG.error(f"File '{new_file_path}' already exists, skipping....")
+            else:
+                dest_dir: str = os.path.dirname(new_file_path)
+                if dest_dir not in dest_dev_cache:
+                    dest_dev_cache[dest_dir] = os.stat(dest_dir).st_dev
+                if os.stat(old_file_path).st_dev == dest_dev_cache[dest_dir]:
+                    # Same filesystem, so a rename is just an inode update
+                    # instead of copying gigabytes of audio byte by byte.
+                    os.replace(old_file_path, new_file_path)
+                else:
+                    shutil.move(
+                        old_file_path, new_file_path, copy_function=shutil.copy
+                    )
+                # Set file permisisons
+                if perms:
+                    os.chmod(new_file_path, file_mode_int)
+                LOG.info(f"Done moving file '{old_file_path}'.")
+        except Exception as e:
+            LOG.error(f"Error moving file '{old_file_path}': {e}")
 
-    for file in files:
-        LOG.debug(f"Processing file: '{file}'")
+    # stream files out of the source tree as they are discovered, skipping
+    # the destination subtree so already-organized books aren't reprocessed
+    # when organizing in place
+    files = get_file_list(source, "m4b", recurse, exclude_dir=os.path.abspath(destination))
+    file_count: int = 0
+
+    # Local bindings for the per-file loop: LOAD_FAST instead of
+    # LOAD_GLOBAL + attribute lookup on every iteration.
+    _debug = LOG.debug
+    _error = LOG.error
+    _filter = filter_path_name
+    _basename = os.path.basename
+    _dirname = os.path.dirname
+
+    def resolve_names(file: str) -> tuple[str, str]:
+        """Work out (author, title) for one file from tags or its name."""
+        _debug("Processing file: '%s'", file)
+
+        # Cheap suffix check before any tag reads or regex work. Directory
+        # listings are already filtered by extension, but a file passed
+        # directly as the source is not.
+        if not file.endswith(".m4b"):
+            _debug("Skipping non-m4b file: '%s'", file)
+            return "", ""
 
         title_name: str = ""
         author_name: str = ""
 
-        # read author and title from tags, if available
+        # read author and title from tags, if available; one .get per tag so
+        # each atom lookup happens exactly once, shared by the debug block
+        # and the checks below
+        album_artist = artist = album = track_title = None
         try:
-            m4b: MP4 = MP4(file)
-            LOG.debug(f"Album artist: {m4b[Tag.ALBUM_ARTIST.value]}")
-            LOG.debug(f"Artist: {m4b[Tag.ARTIST.value]}")
-            LOG.debug(f"Album: {m4b[Tag.ALBUM.value]}")
-            LOG.debug(f"Title: {m4b[Tag.TRACK_TITLE.value]}")
+            m4b: MP4 = open_mp4(file)
+            album_artist = m4b.get(Tag.ALBUM_ARTIST)
+            artist = m4b.get(Tag.ARTIST)
+            album = m4b.get(Tag.ALBUM)
+            track_title = m4b.get(Tag.TRACK_TITLE)
+            _debug("Album artist: %s", album_artist)
+            _debug("Artist: %s", artist)
+            _debug("Album: %s", album)
+            _debug("Title: %s", track_title)
         except Exception as e:
-            LOG.error(f"Error reading tags: {e}\nFalling back to filename parsing.")
+            _error(f"Error reading tags: {e}\nFalling back to filename parsing.")
 
-        try:
+        if album_artist and artist:
             # split the tags by delimiter in case there are multiple authors
             # we are NOT handling multiple tag entries for the same MP4 tag
-            album_artist_tag: list[str] = m4b[Tag.ALBUM_ARTIST.value][0].split(
-                TAG_DELIMITER
-            )
-            artist_tag: list[str] = m4b[Tag.ARTIST.value][0].split(TAG_DELIMITER)
+            album_artist_tag: list[str] = album_artist[0].split(TAG_DELIMITER)
+            artist_tag: list[str] = artist[0].split(TAG_DELIMITER)
 
-            album_artist_tag.sort()
-            artist_tag.sort()
-
-            if album_artist_tag == artist_tag:
-                author_name = album_artist_tag[0]
+            # order-insensitive equality without sorting either list in place
+            if set(album_artist_tag) == set(artist_tag):
+                author_name = min(album_artist_tag)
             else:
-                LOG.error(
+                _error(
                     f"Album artist and artist tags do not match: {album_artist_tag}, {artist_tag}. "
                     "Falling back to filename parsing."
                 )
-        except KeyError:
-            LOG.error(
+        else:
+            _error(
                 "No album artist or artist tag found. Falling back to filename parsing."
             )
-        except Exception as e:
-            LOG.error(f"Error reading tags: {e}")
 
-        try:
-            title_name_tag: str = m4b[Tag.TRACK_TITLE.value][0]
-            album: str = m4b[Tag.ALBUM.value][0]
-            if title_name_tag == album:
-                title_name = title_name_tag
+        if track_title and album:
+            if track_title[0] == album[0]:
+                title_name = track_title[0]
             else:
-                LOG.error(
-                    f"Title name and album tags do not match: {title_name_tag}, {album}. "
+                _error(
+                    f"Title name and album tags do not match: {track_title[0]}, {album[0]}. "
                     "Falling back to filename parsing."
                 )
-        except KeyError:
-            LOG.error("No title tag found. Falling back to filename parsing.")
-        except Exception as e:
-            LOG.error(f"Error reading tags: {e}")
+        else:
+            _error("No title tag found. Falling back to filename parsing.")
 
         if title_name and author_name:
             # Got both from tags
             pass
         else:
-            # otherwise fall back to filename parsing
-            matches: list[Any] = pattern.findall(os.path.basename(file))
-            LOG.debug(f"Matches: '{matches}'")
-            if len(matches) > 1:
-                raise Exception("More than one match found")
-            elif matches and len(matches[0]) == 2:
-                LOG.debug(f"File split: '{matches[0]}'")
-                # LOG.debug(f"Root: '{root}'")
-                # create the new directory name
-                author_name = matches[0][0]
-                LOG.debug(f"Author name: '{author_name}'")
-                # create the new subdirectory name
-                title_name = matches[0][1]
-                LOG.debug(f"Title name: '{title_name}'")
-                # create the new file name, filtering out annoying characters
-        new_file: str = filter_path_name(f"{author_name} - {title_name}.m4b")
-        LOG.debug(f"Built file name: '{new_file}'")
-        author_dir: str = os.path.join(destination, filter_path_name(author_name))
-        LOG.debug(f"Generated author directory: '{author_dir}'")
-        title_dir: str = os.path.join(author_dir, filter_path_name(title_name))
-        LOG.debug(f"Generated title directory: '{title_dir}'")
+            # otherwise fall back to filename parsing; the separator is a
+            # fixed literal, so a single-pass str.partition does the job
+            # without involving the regex engine
+            stem: str = _basename(file)[: -len(".m4b")]
+            author_name, sep, title_name = stem.partition(" - ")
+            if not sep:
+                # no separator in the name; nothing to split on
+                author_name = title_name = ""
+            _debug("Author name: '%s'", author_name)
+            _debug("Title name: '%s'", title_name)
+
+        if not (author_name and title_name):
+            # tags were unusable and the filename didn't parse; leave the
+            # file alone rather than filing it under an empty author/title
+            _error(f"Could not determine author and title for '{file}', skipping....")
+            return "", ""
+
+        return author_name, title_name
+
+    # Tag reads are independent per-file I/O, so overlap them in a thread
+    # pool; map() yields resolved names in input order while planning,
+    # directory creation, and bookkeeping stay single-threaded below, which
+    # keeps prepared_dirs/move_plan/prune_dirs free of locks.
+    files = list(files)
+    with ThreadPoolExecutor(
+        max_workers=min(32, (os.cpu_count() or 1) * 4)
+    ) as tag_pool:
+        resolved: list[tuple[str, str]] = list(tag_pool.map(resolve_names, files))
+
+    for file, (author_name, title_name) in zip(files, resolved):
+        file_count += 1
+        if not (author_name and title_name):
+            # already logged by resolve_names
+            continue
+
+        # filter annoying characters out of each component once and build
+        # every path from the clean parts (the separator and extension
+        # contain no reject characters)
+        clean_author: str = _filter(author_name)
+        clean_title: str = _filter(title_name)
+        new_file: str = f"{clean_author} - {clean_title}.m4b"
+        _debug("Built file name: '%s'", new_file)
+        author_dir: str = join_path(destination, clean_author)
+        _debug("Generated author directory: '%s'", author_dir)
+        title_dir: str = join_path(author_dir, clean_title)
+        _debug("Generated title directory: '%s'", title_dir)
         old_file_path: str = file
-        LOG.debug(f"Old file path: '{old_file_path}'")
-        new_file_path: str = os.path.join(title_dir, new_file)
-        LOG.debug(f"New file path: '{new_file_path}'")
+        _debug("Old file path: '%s'", old_file_path)
+        new_file_path: str = join_path(title_dir, new_file)
+        _debug("New file path: '%s'", new_file_path)
+
+        # two sources resolving to the same author/title collide; keep the
+        # first and skip the rest, like the existing-file check does on disk
+        if new_file_path in planned_dests:
+            _error(
+                f"File '{new_file_path}' already queued from another source, "
+                f"skipping '{old_file_path}'...."
+            )
+            continue
+        planned_dests.add(new_file_path)
 
         # Create destination directories as needed
-        try:
-            os.mkdir(author_dir)
-        except FileExistsError:
-            # This is fine, continue
-            pass
-        if perms: 
-            os.chmod(author_dir, dir_mode_int)
-        try:
-            os.mkdir(title_dir)
-        except FileExistsError:
-            # This is fine, continue
-            pass
-        if perms: 
-            os.chmod(title_dir, dir_mode_int)
+        ensure_dirs(author_dir, title_dir)
 
-        # move the file to the destination
-        LOG.info(
-            f"Moving file '{old_file_path}' to '{new_file_path}'. This may take a while...."
-        )
-        # use shutil.copy because we don't really care about keeping metadata
-        # that shutil.copy2 would keep, and it can cause unnecessary issues on
-        # some filesystems
-        try:
-            if os.path.isfile(new_file_path):
-                LOG.error(f"File '{new_file_path}' already exists, skipping....")
-            else:
-                shutil.move(old_file_path, new_file_path, copy_function=shutil.copy)
-                # Set file permisisons
-                if perms: 
-                    os.chmod(new_file_path, file_mode_int)
-                LOG.info(f"Done moving file '{old_file_path}'.")
-        except Exception as e:
-            LOG.error(f"Error moving file '{old_file_path}': {e}")
-            continue
+        # queue the move for execution after planning
+        move_plan.append((old_file_path, new_file_path))
+
+        # add the directory to the prune set
+        prune_dirs.add(_dirname(old_file_path))
 
-        # add the directory to the prune list
-        parent_dir: str = os.path.dirname(old_file_path)
-        if parent_dir not in prune_list:
-            prune_list.append(parent_dir)
+    if file_count == 0:
+        LOG.error(f"No files found in '{source}'.")
+
+    # Group moves by source directory so files on the same device (and in the
+    # same page-cache-warm directory) are handled together.
+    move_plan.sort(key=lambda paths: os.path.dirname(paths[0]))
+
+    # Split the plan into small and large queues. Small files are cheap
+    # renames that benefit from extra concurrency, while multi-GB audio files
+    # would just thrash the disk with too many parallel copies, so they stick
+    # to the user-provided worker count.
+    small_file_bytes: int = 16 * 1024 * 1024
+    small_moves: list[tuple[str, str]] = []
+    large_moves: list[tuple[str, str]] = []
+    for paths in move_plan:
+        try:
+            file_size: int = os.stat(paths[0]).st_size
+        except OSError:
+            file_size = small_file_bytes
+        if file_size < small_file_bytes:
+            small_moves.append(paths)
+        else:
+            large_moves.append(paths)
+
+    # Moves are pure I/O wait, so overlapping them with a thread pool helps
+    # when the destination is on another filesystem or a network mount.
+    # The default of one worker keeps large moves sequential.
+    if small_moves:
+        with ThreadPoolExecutor(max_workers=max(jobs, 4)) as executor:
+            list(executor.map(move_file, small_moves))
+    if large_moves:
+        with ThreadPoolExecutor(max_workers=jobs) as executor:
+            list(executor.map(move_file, large_moves))
 
     if prune:
         LOG.debug("pruning empty directories.")
-        LOG.debug(f"Prune list: '{prune_list}'")
-        for dir in prune_list:
+        LOG.debug("Prune dirs: '%s'", prune_dirs)
+        # deepest dirs first, so a nested dir is emptied (and pruned) before
+        # its parent is considered
+        for dir in sorted(prune_dirs, key=len, reverse=True):
             try:
-                LOG.debug(f"Pruning directory: '{dir}'")
+                # Peek at the directory first so dirs that still hold files
+                # skip quietly instead of failing out of removedirs.
+                with os.scandir(dir) as entries:
+                    if next(entries, None) is not None:
+                        LOG.debug("Directory '%s' not empty, skipping.", dir)
+                        continue
+                LOG.debug("Pruning directory: '%s'", dir)
                 os.removedirs(dir)
             except Exception as e:
                 LOG.error(f"Error pruning directory '{dir}': {e}")
@@ -252,14 +401,14 @@ def organize_files(
 @click.option(
     "--source",
     "-s",
-    default=CWD,
+    default=lambda: os.getcwd(),
     show_default=False,
     help="Source directory to pull audio files from. Not recursive. Defaults to current directory.",
 )
 @click.option(
     "--destination",
     "-d",
-    default=CWD,
+    default=lambda: os.getcwd(),
     show_default=False,
     help="Destination directory to concatenate files to. Defaults to current directory.",
 )
@@ -288,23 +437,37 @@ def concat_files(source: str, recurse: bool, destination: str, format: str):
         # escape all characters that are not safe
         return "".join([c if c in safe_chars else f"\\{c}" for c in filename])
 
-    def generate_metadata_file(files: list, destination: str, format: str):
-        """Generate metadata file for ffmpeg to use for chapter markers."""
-        LOG.debug(f"Generating metadata file for ffmpeg")
-        LOG.debug(f"Files: '{files}'")
-        LOG.debug(f"Destination: '{destination}'")
-        LOG.debug(f"Format: '{format}'")
-
-        chapters: list[dict[str, Any]] = []
-
-        for file in files:
-            LOG.debug(f"Processing file: '{file}'")
+    def generate_metadata_file(
+        files: list, destination: str, format: str
+    ) -> tuple[str, str]:
+        """
+        Generate the metadata and file-list files for ffmpeg in one pass.
+
+        Returns (metadata path, file-list path).
+        """
+        LOG.debug("Generating metadata file for ffmpeg")
+        LOG.debug("Files: '%s'", files)
+        LOG.debug("Destination: '%s'", destination)
+        LOG.debug("Format: '%s'", format)
+
+        chapters: list[_Chapter] = []
+
+        # Durations are immutable for unchanged bytes, so cache them keyed on
+        # (path, size, mtime) across runs; re-running concat while tuning
+        # chapter names then skips every ffprobe spawn.
+        cache_path: str = os.path.join(destination, ".probe_cache.json")
+        try:
+            with open(cache_path) as c:
+                probe_cache: dict[str, int] = json.load(c)
+        except (OSError, ValueError):
+            probe_cache = {}
+
+        def probe_duration(file: str) -> tuple[str, int]:
+            """Probe one file, returning (chapter title, duration in µs)."""
+            LOG.debug("Processing file: '%s'", file)
             file_path: str = os.path.join(destination, file)
-            # extract chapter number from filename
-            # ch_pattern: re.Pattern = re.compile(r"[^\d]*(\d+)\....$")
-            ch_pattern: re.Pattern = re.compile(r"^(\d+)(.+)\.[^\.]+$")
-            m = ch_pattern.match(file)
-            LOG.debug(f"Match: {m}")
+            m = _CH_PATTERN.match(file)
+            LOG.debug("Match: %s", m)
             try:
                 number: str = m[1]
                 title: str = m[2]
@@ -312,136 +475,228 @@ def concat_files(source: str, recurse: bool, destination: str, format: str):
                 raise RuntimeError(
                     f"Error extracting chapter number from '{file}' - check your naming?"
                 ) from e
-            LOG.debug(f"Extracted chapter number: '{number}'")
+            LOG.debug("Extracted chapter number: '%s'", number)
+
+            st: os.stat_result = os.stat(file_path)
+            cache_key: str = f"{file_path}:{st.st_size}:{st.st_mtime_ns}"
+            cached = probe_cache.get(cache_key)
+            if cached is not None:
+                LOG.debug("Probe cache hit for '%s'", file_path)
+                return title, cached
+
+            # mutagen parses just the container header in-process, which is
+            # orders of magnitude cheaper than spawning ffprobe; fall through
+            # to ffprobe only for containers mutagen doesn't recognize
+            try:
+                info = MutagenFile(file_path)
+            except Exception as e:
+                LOG.debug("mutagen could not read '%s': %s", file_path, e)
+                info = None
+            if info is not None and info.info.length:
+                duration_in_microseconds = int(
+                    round(info.info.length * 1_000_000)
+                )
+                LOG.debug(
+                    "Duration in microseconds: %s", duration_in_microseconds
+                )
+                probe_cache[cache_key] = duration_in_microseconds
+                return title, duration_in_microseconds
 
             cmd: list[str] = [
-                    "ffprobe",
-                    "-v",
-                    "quiet",
-                    "-of",
-                    "csv=p=0",
-                    "-show_entries",
-                    "format=duration",
-                    file_path,
+                "ffprobe",
+                "-v",
+                "quiet",
+                "-print_format",
+                "json",
+                "-show_entries",
+                "format=duration",
+                file_path,
             ]
-            LOG.debug(f"Running command: {cmd}")
+            LOG.debug("Running command: %s", cmd)
 
-            # Build cmd
             probe: subprocess.CompletedProcess = subprocess.run(
                 cmd,
                 shell=False,
                 capture_output=True,
             )
-            LOG.debug(f"Probe: {probe}")
-            LOG.debug(f"Probe stdout: {probe.stdout}")
-            duration_in_microseconds = int(
-                probe.stdout.decode().strip().replace(".", "")
-            )
-            LOG.debug(f"Duration in microseconds: {duration_in_microseconds}")
-            chapters.append({"duration": duration_in_microseconds})
-            chapters[-1]["title"] = title
-
-        chapters[0]["start"] = 0
-        for n in range(len(chapters)):
-            chapter_index: int = n
-            next_chapter_index: int = n + 1
-            chapters[chapter_index]["end"] = (
-                chapters[chapter_index]["start"] + chapters[chapter_index]["duration"]
-            )
-            try:
-                chapters[next_chapter_index]["start"] = (
-                    chapters[chapter_index]["end"] + 1
+            LOG.debug("Probe: %s", probe)
+            LOG.debug("Probe stdout: %s", probe.stdout)
+            # JSON output with a float parse is robust to however many
+            # decimal digits ffprobe decides to print, unlike stripping the
+            # dot out of the csv form and hoping for exactly six.
+            duration: str = json.loads(probe.stdout)["format"]["duration"]
+            duration_in_microseconds = int(round(float(duration) * 1_000_000))
+            LOG.debug("Duration in microseconds: %s", duration_in_microseconds)
+            probe_cache[cache_key] = duration_in_microseconds
+            return title, duration_in_microseconds
+
+        # Ask the kernel to pull every container header into the page cache
+        # up front, so the probes below read warm pages instead of each
+        # faulting its header in one at a time.
+        prefetch_headers([os.path.join(destination, file) for file in files])
+
+        # Each probe blocks on a single-threaded ffprobe process, so the work
+        # is embarrassingly parallel; map() keeps results in input order so
+        # chapters still come out in file order. A running cursor computes
+        # the start/end offsets in the same pass, so no second walk over the
+        # list and no exception-driven handling of the final chapter.
+        # files.txt lines are collected in the same pass, so the listing is
+        # only walked once for both outputs
+        file_lines: list[str] = []
+        cursor: int = 0
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file, (title, duration_in_microseconds) in zip(
+                files, executor.map(probe_duration, files)
+            ):
+                file_lines.append(f"file {clean_ffmpeg_filename(file)}\n")
+                chapters.append(
+                    _Chapter(
+                        start=cursor,
+                        end=cursor + duration_in_microseconds,
+                        duration=duration_in_microseconds,
+                        title=title,
+                    )
                 )
-            except IndexError:
-                # last one, continue on
-                pass
+                cursor += duration_in_microseconds + 1
+
+        try:
+            with open(cache_path, "w") as c:
+                json.dump(probe_cache, c)
+        except OSError as e:
+            # cache is an optimization only; never fail the run over it
+            LOG.debug("Could not write probe cache: %s", e)
 
         metadata_path = os.path.join(destination, "metadata.txt")
 
         # Metadata file format spec https://ffmpeg.org/ffmpeg-formats.html#Metadata-2
-        with open(metadata_path, "w+") as m:
-            m.writelines(";FFMETADATA1\n")
-            chapter: dict[str, Any]
-            for chapter in chapters:
-                ch_meta = """
+        # Assemble the whole payload first so the file sees one write call
+        # and one UTF-8 encode instead of one per chapter.
+        chunks: list[str] = [";FFMETADATA1\n"]
+        chapter: _Chapter
+        for chapter in chapters:
+            chunks.append(
+                """
 [CHAPTER]
 TIMEBASE=1/1000000
 START={}
 END={}
 title={}""".format(
-                    chapter["start"], chapter["end"], chapter["title"].strip()
+                    chapter.start, chapter.end, chapter.title.strip()
                 )
-                m.writelines(ch_meta)
+            )
+        with open(metadata_path, "w+") as m:
+            m.write("".join(chunks))
+
+        file_list_path = os.path.join(destination, "files.txt")
+        with open(file_list_path, "w+") as f:
+            f.write("".join(file_lines))
+
+        return metadata_path, file_list_path
 
     ##########################
     # Start of command logic #
     ##########################
 
     # create destination directory if it does not exist
-    try:
-        os.mkdir(destination)
-    except FileExistsError:
-        # This is fine, continue
-        pass
-
-    # list all files in source dir only (no subdirectories) for files to search through
-    files: list[str] = os.listdir(source)
-    LOG.debug(f"Files: '{files}'")
-
-    # filter for the correct files
-    audio_files: list[str] = [f for f in files if f.endswith(format)]
-
-    # sort files by name
-    audio_files.sort()
+    os.makedirs(destination, exist_ok=True)
+
+    # normalize to a dotted suffix so -f mp3 can't match e.g. 'foo.xmp3'
+    ext: str = "." + format.lstrip(".")
+
+    # list matching files in source dir only (no subdirectories); scandir
+    # streams entries and reuses the dirent type info, so filtering costs no
+    # extra stat per entry and no intermediate full listing
+    with os.scandir(source) as entries:
+        audio_files: list[str] = sorted(
+            (e.name for e in entries if e.is_file() and e.name.endswith(ext)),
+            key=_chapter_sort_key,
+        )
+    LOG.debug("Audio files: '%s'", audio_files)
 
-    LOG.info(f"generating metadata file for: {audio_files}")
-    generate_metadata_file(files=audio_files, destination=destination, format=format)
+    LOG.info(f"generating metadata and file list for: {audio_files}")
+    metadata_path, file_list_path = generate_metadata_file(
+        files=audio_files, destination=destination, format=format
+    )
 
-    file_list_path: str = os.path.join(destination, "files.txt")
-    mp4_path: str = os.path.join(destination, "output.mp4")
+    # write the m4b directly; mp4 and m4b are the same container, and
+    # +faststart moves the moov atom to the head so players open the file
+    # without seeking to the tail first
     m4b_path: str = os.path.join(destination, "output.m4b")
-    metadata_path: str = os.path.join(destination, "metadata.txt")
 
-    LOG.info(f"Generating file list for ffmpeg")
-    with open(file_list_path, "w+") as f:
-        for file in audio_files:
-            f.write(f"file {clean_ffmpeg_filename(file)}\n")
-
-    # check current bitrate of audio files
+    # check current stream parameters of audio files
     bitrates: list[int] = []
-    LOG.info(f"Checking bitrate of audio files: {audio_files}")
+    # (codec, sample rate, channels) per file, for the remux fast path
+    stream_sigs: list[tuple[str, str, str]] = []
+    LOG.info(f"Checking stream parameters of audio files: {audio_files}")
     for file in audio_files:
         cmd: list[str] = [
             "ffprobe",
             "-v",
             "error",
             "-show_entries",
-            "stream=bit_rate",
+            "stream=codec_name,sample_rate,channels,bit_rate",
             "-select_streams",
             "a",
             "-of",
             "default=noprint_wrappers=1:nokey=1",
             file,
         ]
-        LOG.debug(f"Running command: {cmd}")
+        LOG.debug("Running command: %s", cmd)
 
         s: subprocess.CompletedProcess = subprocess.run(
             cmd,
             shell=False,
             capture_output=True,
         )
-        LOG.debug(f"Output: {s}")
+        LOG.debug("Output: %s", s)
         try:
-            bitrate = int(s.stdout)
-            LOG.debug(f"Bitrate: {bitrate}")
+            codec_name, sample_rate, channels, bitrate_raw = s.stdout.decode().split()
+            bitrate = int(bitrate_raw)
+            LOG.debug("Bitrate: %s", bitrate)
+            stream_sigs.append((codec_name, sample_rate, channels))
             bitrates.extend([bitrate] if bitrate not in bitrates else [])
         except Exception as e:
-            LOG.error(f"Error checking bitrate: {e}")
-    LOG.debug(f"Bitrates: {bitrates}")
+            LOG.error(f"Error checking stream parameters: {e}")
+    LOG.debug("Bitrates: %s", bitrates)
+    LOG.debug("Stream signatures: %s", stream_sigs)
 
     LOG.info(f"Concatenating files: {audio_files}")
+    # When every input is already aac with identical stream parameters, the
+    # concat is a pure container remux - no decode or re-encode at all.
+    # Every file must have probed successfully: a failed probe only logs and
+    # leaves the file out of stream_sigs, and an unverified input must not
+    # be stream-copied.
+    if (
+        len(stream_sigs) == len(audio_files)
+        and len(set(stream_sigs)) == 1
+        and stream_sigs[0][0] == "aac"
+        and bitrates
+        and bitrates[0] <= 64000
+    ):
+        LOG.info("Inputs share identical aac streams; remuxing without re-encode.")
+        ffmpeg_cmd: list[str] = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            "concat",
+            "-safe",
+            "0",
+            "-i",
+            file_list_path,
+            "-i",
+            metadata_path,
+            "-map_metadata",
+            "1",
+            "-c:a",
+            "copy",
+            "-f",
+            "mp4",
+            "-movflags",
+            "+faststart",
+            m4b_path,
+        ]
     # Depending on bitrate, down transcode to 64kbps or not
-    if bitrates and (len(bitrates) > 1 or bitrates[0] <= 64000):
+    elif bitrates and (len(bitrates) > 1 or bitrates[0] <= 64000):
         if len(bitrates) > 1:
             LOG.warning("Audio files have different bitrates.")
         if bitrates[0] < 64000:
@@ -461,7 +716,11 @@ title={}""".format(
             "1",
             "-c:a",
             "aac",
-            mp4_path,
+            "-f",
+            "mp4",
+            "-movflags",
+            "+faststart",
+            m4b_path,
         ]
     else:
         # Higher bitrates get transcoded to 64kbps
@@ -482,33 +741,42 @@ title={}""".format(
             "aac",
             "-b:a",
             "64k",
-            mp4_path,
+            "-f",
+            "mp4",
+            "-movflags",
+            "+faststart",
+            m4b_path,
         ]
-    LOG.debug(f"ffmpeg command: {ffmpeg_cmd}")
-
-    # run ffmpeg command
-    try:
-        s = subprocess.run(
-            ffmpeg_cmd,
-            shell=False,
-            capture_output=True
-        )
-        LOG.debug(f"ffmpeg output: {s}")
-    except Exception as e:
-        LOG.error(f"Error running ffmpeg: {e}")
+    # stream machine-readable progress over stdout instead of blocking
+    # silently until the (potentially hours-long) concat finishes
+    ffmpeg_cmd[-1:-1] = ["-progress", "pipe:1", "-nostats", "-loglevel", "error"]
+    LOG.debug("ffmpeg command: %s", ffmpeg_cmd)
+
+    # run ffmpeg command, draining progress lines as they arrive
+    proc: subprocess.Popen = subprocess.Popen(
+        ffmpeg_cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    # drain stderr on a worker so a chatty ffmpeg can't fill the pipe
+    # buffer and deadlock against the progress loop below
+    with ThreadPoolExecutor(max_workers=1) as stderr_pool:
+        errors_future = stderr_pool.submit(proc.stderr.read)  # type: ignore[union-attr]
+        for line in proc.stdout:  # type: ignore[union-attr]
+            line = line.strip()
+            if line.startswith("out_time="):
+                LOG.info("Concat progress: %s", line.partition("=")[2])
+        proc.wait()
+        errors: str = errors_future.result()
 
     # check command exit code
-    if s.returncode != 0:
-        raise RuntimeError(f"ffmpeg command failed with exit code {s.returncode}")
-
-    # rename output file to m4b
-    shutil.move(
-        os.path.join(destination, "output.mp4"), os.path.join(destination, "output.m4b")
-    )
+    if proc.returncode != 0:
+        raise RuntimeError(
+            f"ffmpeg command failed with exit code {proc.returncode}: {errors}"
+        )
 
-    LOG.info(
-        f"Done concatenating files. Output file: {os.path.join(destination, 'output.m4b')}"
-    )
+    LOG.info(f"Done concatenating files. Output file: {m4b_path}")
 
 
 @click.command(context_settings=COMMON_CONTEXT, name="autoname")
@@ -1,6 +1,9 @@
+import difflib
+import functools
+import json
 import os
 import shutil
-from time import sleep
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import click
@@ -8,107 +11,329 @@ from mutagen.mp4 import MP4, MP4Cover
 
 from util.constants import COMMON_CONTEXT, LOG, TAG_DELIMITER
 from util.decorators import common_logging, common_options, common_tag_options
-from util.file import get_file_list, filter_path_name
-from util.mp4 import GENRES, Tag, pprint_tags
-
-
-def set_description_tags(m4b: MP4, description: str = "", prompt: bool = True) -> None:
-    """Set description/comment tags. Prompt user for input if not provided."""
-
-    def query_for_description() -> None:
-        # Open an editor for full multiline tag editing
-        instruction = f"# Enter new value for the Comment/Description:\n"
-        new_tag_value: str | None = click.edit(instruction)
+from util.file import get_file_list, filter_path_name, prefetch_headers
+from util.mp4 import GENRES, GENRES_BY_FOLD, GENRES_SET, Tag, open_mp4, pprint_tags
+
+# Atom keys hoisted out of the Tag enum: a plain global string load beats
+# the enum attribute + descriptor lookup inside the per-file loops.
+_ARTIST: str = Tag.ARTIST.value
+_ALBUM_ARTIST: str = Tag.ALBUM_ARTIST.value
+_TITLE: str = Tag.TRACK_TITLE.value
+_ALBUM: str = Tag.ALBUM.value
+_DESC: str = Tag.DESCRIPTION.value
+_COMMENT: str = Tag.COMMENT.value
+_SERIES_NAME: str = Tag.SERIES_NAME.value
+_SERIES_PART: str = Tag.SERIES_PART.value
+_GENRE: str = Tag.GENRE.value
+_NARRATOR: str = Tag.NARRATOR.value
+_YEAR: str = Tag.YEAR.value
+
+# Shared default for tag reads; a tuple literal avoids allocating a fresh
+# [None] list on every .get call.
+_NONE_TUPLE: tuple = (None,)
+
+# The freeform atoms that store bytes rather than text; hashed membership
+# instead of a linear tuple scan in the editor apply loop.
+_SERIES_TAGS: frozenset[Tag] = frozenset((Tag.SERIES_NAME, Tag.SERIES_PART))
+
+# Files that already passed the required-tags check, keyed by absolute path
+# with their (mtime_ns, size) at the time. Lets audit-style reruns skip
+# unchanged files without re-parsing or re-prompting.
+_TAGGED_CACHE_PATH: str = os.path.expanduser("~/.cache/audiobook-tools/tagged.json")
+
+
+def _load_tagged_cache() -> dict[str, list[int]]:
+    try:
+        with open(_TAGGED_CACHE_PATH) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_tagged_cache(cache: dict[str, list[int]]) -> None:
+    try:
+        os.makedirs(os.path.dirname(_TAGGED_CACHE_PATH), exist_ok=True)
+        with open(_TAGGED_CACHE_PATH, "w") as f:
+            json.dump(cache, f)
+    except OSError as e:
+        # the cache is an optimization only
+        LOG.debug("Could not write tagged cache: %s", e)
+
+
+def _stat_sig(file: str) -> list[int]:
+    st: os.stat_result = os.stat(file)
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _no_new_padding(info) -> int:
+    """Keep whatever padding the file already has instead of growing it.
+
+    When the new tag block fits the existing padding, mutagen can then
+    rewrite just the header area in place; the default policy may grow the
+    padding and force a rewrite of the whole multi-hundred-MB container.
+    """
+    return max(info.padding, 0)
+
+
+def set_description_tags(m4b: MP4, description: str = "", prompt: bool = True) -> bool:
+    """Set description/comment tags. Prompt user for input if not provided.
+
+    Returns True if any tag was written, so callers can skip redraws when
+    nothing changed.
+    """
+
+    def query_for_description(reason: str = "") -> bool:
+        # Open an editor for full multiline tag editing; the reason the
+        # editor opened rides along as a comment line so no blocking pause
+        # is needed for the user to read it
+        instruction = "# Enter new value for the Comment/Description:\n"
+        buffer: str = f"# {reason}\n{instruction}" if reason else instruction
+        new_tag_value: str | None = click.edit(buffer)
         if new_tag_value:
-            try:
-                # strip out the instruction if it's still there
-                stripped_tag_value: str = new_tag_value.split(instruction)[1].strip()
-
-                # Always set both description and comment tags at the same time
-                m4b[Tag.DESCRIPTION.value] = stripped_tag_value
-                m4b[Tag.COMMENT.value] = stripped_tag_value
-            except:
-                # if the instruction is not there, try to remove any lines that start with '#'
+            # strip out the instruction if it's still there; otherwise fall
+            # back to dropping any '#' comment lines the user left behind
+            _, found, after = new_tag_value.partition(instruction)
+            if found:
+                stripped_tag_value: str = after.strip()
+            else:
                 stripped_tag_value = "\n".join(
-                    [
-                        line.strip()
-                        for line in new_tag_value.splitlines()
-                        if not line.startswith("#")
-                    ]
+                    line.strip()
+                    for line in new_tag_value.splitlines()
+                    if not line.startswith("#")
                 ).strip()
-                # Always set both description and comment tags at the same time
-                m4b[Tag.DESCRIPTION.value] = stripped_tag_value
-                m4b[Tag.COMMENT.value] = stripped_tag_value
+
+            # Always set both description and comment tags at the same time
+            m4b[_DESC] = stripped_tag_value
+            m4b[_COMMENT] = stripped_tag_value
+            return True
+        return False
 
     if description:
         # Always set both description and comment tags at the same time
-        m4b[Tag.DESCRIPTION.value] = description
-        m4b[Tag.COMMENT.value] = description
+        m4b[_DESC] = description
+        m4b[_COMMENT] = description
+        return True
     elif prompt:
-        query_for_description()
+        return query_for_description()
     else:
         # TODO Also prompt if the description is shorter than 100 characters.
         # Check both description and comment
-        tag_description: str = m4b.get(Tag.DESCRIPTION.value, [None])[0]  # type: ignore
-        tag_comment: str = m4b.get(Tag.COMMENT.value, [None])[0]  # type: ignore
+        tag_description: str = m4b.get(_DESC, [None])[0]  # type: ignore
+        tag_comment: str = m4b.get(_COMMENT, [None])[0]  # type: ignore
 
         # Fill in missing tags first
         if tag_description:
             if len(tag_description) < 100:
-                LOG.warning(
+                reason: str = (
                     f"Description tag '{tag_description}' is less than 100 characters."
                 )
-                sleep(2)
-                query_for_description()
+                LOG.warning(reason)
+                return query_for_description(reason)
             elif not tag_comment:
-                m4b[Tag.COMMENT.value] = tag_description
+                m4b[_COMMENT] = tag_description
+                return True
             elif tag_comment != tag_description:
-                LOG.warning(
+                reason = (
                     f"Description tag '{tag_description}' does not match comment '{tag_comment}'."
                 )
-                sleep(2)
-                query_for_description()
+                LOG.warning(reason)
+                return query_for_description(reason)
         elif tag_comment:
             if len(tag_comment) < 100:
-                LOG.warning(f"Comment tag '{tag_comment}' is less than 100 characters.")
-                sleep(2)
-                query_for_description()
+                reason = f"Comment tag '{tag_comment}' is less than 100 characters."
+                LOG.warning(reason)
+                return query_for_description(reason)
             else:
-                m4b[Tag.DESCRIPTION.value] = tag_comment
+                m4b[_DESC] = tag_comment
+                return True
         else:
-            query_for_description()
+            return query_for_description()
+    return False
+
+
+@functools.lru_cache(maxsize=8)
+def _load_cover(cover_path: str) -> MP4Cover:
+    """Read a cover image into an MP4Cover, memoized by path.
+
+    Books in a series typically share one cover, so tagging a directory
+    reads the image bytes once instead of once per file.
+    """
+    image_format: int = (
+        MP4Cover.FORMAT_PNG
+        if cover_path.lower().endswith(".png")
+        else MP4Cover.FORMAT_JPEG
+    )
+    with open(cover_path, "rb") as f:
+        return MP4Cover(f.read(), imageformat=image_format)
+
+
+def _canonicalize_genres(entries: list[str]) -> tuple[list[str], list[str]]:
+    """Map genre entries to their catalog spelling case-insensitively.
+
+    Returns (picks, invalid): the deduped canonical picks in entered order
+    (dict.fromkeys drops duplicates while keeping it), and any entries that
+    aren't in the catalog.
+    """
+    picks: list[str] = list(
+        dict.fromkeys(
+            GENRES_BY_FOLD.get(e.strip().casefold(), e.strip())
+            for e in entries
+            if e.strip()
+        )
+    )
+    invalid: list[str] = [p for p in picks if p not in GENRES_SET]
+    return picks, invalid
+
+
+def _prompt_genres() -> list[str]:
+    """Prompt for genres as a single comma-separated entry.
+
+    The catalog is rendered once and the whole selection is validated as a
+    batch, instead of a clear/redraw round trip per genre picked.
+    """
+    # TODO Include "custom" genre option
+    # TODO check for and exclude "Audiobook" genre in provided files
+    click.clear()
+    click.echo("Available genres:")
+    click.echo("\n".join(GENRES))
+    while True:
+        raw: str = click.prompt(
+            text="Enter genres (comma-separated), or 'enter' to skip",
+            default="",
+        )
+        if not raw:
+            return []
+        picks, invalid = _canonicalize_genres(raw.split(","))
+        if not invalid:
+            return picks
+        click.echo(f"Invalid genre(s): {', '.join(invalid)}. Try again.")
 
 
 def set_cover_tag(m4b: MP4, cover: Any = None) -> None:
-    click.echo("Cover images not supported yet.")
     # prompt for path to cover image
-    # TODO test aaaaaaaall this shit
-    # cover_path: str = click.prompt(
-    #     text="Enter path to cover image",
-    #     type=click.Path(
-    #         exists=True, file_okay=True, dir_okay=False
-    #     ),
-    # )
-    # LOG.debug(f"Cover file: '{cover_path}'")
-
-    # # quick check file type png or jpg
-    # if (
-    #     not cover_path.endswith(".png")
-    #     and not cover_path.endswith(".jpg")
-    #     and not cover_path.endswith(".jpeg")
-    # ):
-    #     LOG.error(f"Invalid file type: '{cover_path}'")
-    #     continue
-
-    # if cover_path.endswith(".png"):
-    #     imageFormat = MP4Cover.FORMAT_PNG
-    # else:
-    #     imageFormat = MP4Cover.FORMAT_JPEG
-
-    # cover: MP4Cover = MP4Cover(
-    #     cover_path, imageformat=imageFormat
-    # )
-    # m4b[Tag.COVER.value] = [cover]
+    cover_path: str = click.prompt(
+        text="Enter path to cover image, or 'enter' to skip",
+        default="",
+    )
+    if not cover_path:
+        return
+    LOG.debug(f"Cover file: '{cover_path}'")
+
+    if not os.path.isfile(cover_path):
+        LOG.error(f"File '{cover_path}' not found.")
+        return
+
+    # quick check file type png or jpg; a single endswith call takes a tuple
+    # of suffixes, and lowering once keeps it case-insensitive
+    lower_path: str = cover_path.lower()
+    if not lower_path.endswith((".png", ".jpg", ".jpeg")):
+        LOG.error(f"Invalid file type: '{cover_path}'")
+        return
+
+    m4b[Tag.COVER] = [_load_cover(cover_path)]
+
+
+# Tags every audiobook must carry; set_tags checks (and fills) each of these
+# per file, and verify-style scans report the missing ones.
+_REQUIRED_TAGS: tuple[Tag, ...] = (
+    Tag.ARTIST,
+    Tag.NARRATOR,
+    Tag.COVER,
+    Tag.DESCRIPTION,
+    Tag.GENRE,
+    Tag.SERIES_NAME,
+    Tag.TRACK_TITLE,
+    Tag.YEAR,
+)
+
+# Tags the batch editor exposes as plain text lines; cover art and the long
+# description/comment pair keep their dedicated editors.
+_EDITABLE_TAGS: tuple[Tag, ...] = (
+    Tag.ARTIST,
+    Tag.ALBUM_ARTIST,
+    Tag.TRACK_TITLE,
+    Tag.ALBUM,
+    Tag.GENRE,
+    Tag.NARRATOR,
+    Tag.SERIES_NAME,
+    Tag.SERIES_PART,
+    Tag.YEAR,
+)
+
+
+def edit_tags_in_editor(m4b: MP4) -> bool:
+    """
+    Edit all text tags in a single editor session.
+
+    One buffer with every editable tag replaces a prompt round-trip per
+    tag; only lines the user actually changes are written back. COVER and
+    DESCRIPTION accept the value 'edit' to open their dedicated editors.
+    Returns True if any tag was written.
+    """
+    before: dict[str, str] = {}
+    lines: list[str] = [
+        "# Edit values after the colon; unchanged lines are left alone.",
+        "# Set COVER or DESCRIPTION to 'edit' to open their editors.",
+    ]
+    for t in _EDITABLE_TAGS:
+        value = m4b.get(t, _NONE_TUPLE)[0]  # type: ignore
+        if isinstance(value, bytes):
+            value = value.decode("utf-8", "replace")
+        before[t.name] = "" if value is None else str(value)
+        lines.append(f"{t.name}: {before[t.name]}")
+    lines.append("COVER: keep")
+    lines.append("DESCRIPTION: keep")
+
+    edited: str | None = click.edit("\n".join(lines) + "\n")
+    if edited is None:
+        # editor closed without saving; nothing to apply
+        return False
+
+    changed: bool = False
+    for line in edited.splitlines():
+        if not line or line.startswith("#"):
+            continue
+        name, sep, value = line.partition(":")
+        if not sep:
+            continue
+        name = name.strip().upper()
+        value = value.strip()
+        if name == "COVER":
+            if value.lower() == "edit":
+                set_cover_tag(m4b)
+                changed = True
+            continue
+        if name in ("DESCRIPTION", "COMMENT"):
+            if value.lower() == "edit":
+                changed |= set_description_tags(m4b)
+            continue
+        if name in before and value == before[name]:
+            continue
+        tag: Tag | None = Tag.from_name(name)
+        if tag is None:
+            close: list[str] = difflib.get_close_matches(name, Tag.__members__, n=3)
+            hint: str = f" Did you mean: {', '.join(close)}?" if close else ""
+            LOG.error(f"Invalid tag: '{name}'.{hint}")
+            continue
+        if tag is Tag.GENRE:
+            # route through the same catalog validation as every other
+            # genre entry point instead of writing the raw text
+            picks, invalid = _canonicalize_genres(
+                value.replace(",", TAG_DELIMITER).split(TAG_DELIMITER)
+            )
+            if invalid:
+                LOG.error(
+                    f"Invalid genre(s): {', '.join(invalid)}; GENRE left unchanged."
+                )
+                continue
+            m4b[tag] = TAG_DELIMITER.join(picks)
+        elif tag in _SERIES_TAGS:
+            # the freeform series atoms want bytes
+            m4b[tag] = value.encode("utf-8")
+        else:
+            m4b[tag] = value
+        changed = True
+    return changed
 
 
 @click.command(context_settings=COMMON_CONTEXT, name="set")
@@ -128,41 +353,121 @@ def set_tags(
     title: str,
 ):
     """Set audiobook tags on the command line or interactively."""
-    files: list[str] = get_file_list(source, ext="m4b", recurse=recurse)
-    required_tags: list[Tag] = [
-        Tag.ARTIST,
-        Tag.NARRATOR,
-        Tag.COVER,
-        Tag.DESCRIPTION,
-        Tag.GENRE,
-        Tag.SERIES_NAME,
-        Tag.TRACK_TITLE,
-        Tag.YEAR,
-    ]
+    # materialized because prefetch needs the full set before the first parse
+    files: list[str] = list(get_file_list(source, ext="m4b", recurse=recurse))
+    # warm the page cache for the header atoms before parsing one by one
+    prefetch_headers(files)
+    # When every tag option is supplied the run is non-interactive in
+    # intent, so already-matching files can be skipped before any prompts.
+    fully_specified: bool = all(
+        (author, title, date, description, genre, narrator, series_name, series_part)
+    )
+    # With no tag options at all this is a pure audit pass, so files that
+    # already passed the required-tags check and haven't changed on disk can
+    # be skipped without even parsing them.
+    audit_only: bool = not any(
+        (author, title, date, description, genre, narrator, series_name, series_part)
+    )
+    tagged_cache: dict[str, list[int]] = _load_tagged_cache()
 
     for file in files:
-        LOG.debug(f"Processing file: '{file}'")
-        m4b: MP4 = MP4(file)
+        LOG.debug("Processing file: '%s'", file)
+        if audit_only and tagged_cache.get(os.path.abspath(file)) == _stat_sig(file):
+            LOG.info("Skipping '%s'; unchanged since it last passed tagging.", file)
+            continue
+        m4b: MP4 = open_mp4(file)
+
+        # Snapshot the current value of every tag we might inspect, so the
+        # match arms below don't each walk mutagen's atom dict repeatedly.
+        cur: dict[str, Any] = {
+            t.value: m4b.get(t, _NONE_TUPLE)[0]  # type: ignore
+            for t in (
+                Tag.ARTIST,
+                Tag.ALBUM_ARTIST,
+                Tag.TRACK_TITLE,
+                Tag.ALBUM,
+                Tag.SERIES_NAME,
+                Tag.SERIES_PART,
+                Tag.GENRE,
+                Tag.NARRATOR,
+                Tag.YEAR,
+                Tag.DESCRIPTION,
+                Tag.COMMENT,
+            )
+        }
+
+        if fully_specified:
+            # compare the provided values against what's already on disk and
+            # skip the whole interactive flow (and the save) on a match
+            tag_series_name = cur[_SERIES_NAME]
+            tag_series_part = cur[_SERIES_PART]
+            if isinstance(tag_series_name, bytes):
+                tag_series_name = tag_series_name.decode("utf-8")
+            if isinstance(tag_series_part, bytes):
+                tag_series_part = tag_series_part.decode("utf-8")
+            # every tag the write path below sets must match, including the
+            # paired ones (album, album artist, comment), or a file with a
+            # stale pair would be skipped instead of repaired
+            if (
+                cur[_ARTIST] == author
+                and cur[_ALBUM_ARTIST] == author
+                and cur[_TITLE] == title
+                and cur[_ALBUM] == title
+                and cur[_YEAR] == date
+                and cur[_DESC] == description
+                and cur[_COMMENT] == description
+                and cur[_GENRE] == TAG_DELIMITER.join(genre)
+                and cur[_NARRATOR] == narrator
+                and tag_series_name == series_name
+                and tag_series_part == str(series_part)
+            ):
+                LOG.info("All provided tags already set for '%s'; skipping.", file)
+                continue
+
+            # Every value came from the command line, so there is nothing to
+            # prompt for: write the tags, save, and move on with one line of
+            # output instead of the interactive screens.
+            m4b[_TITLE] = title
+            m4b[_ALBUM] = title
+            m4b[_ARTIST] = author
+            m4b[_ALBUM_ARTIST] = author
+            m4b[_YEAR] = date
+            m4b[_NARRATOR] = narrator
+            m4b[_GENRE] = TAG_DELIMITER.join(genre)
+            m4b[_DESC] = description
+            m4b[_COMMENT] = description
+            m4b[_SERIES_NAME] = series_name.encode("utf-8")
+            m4b[_SERIES_PART] = str(series_part).encode("utf-8")
+            m4b.save(padding=_no_new_padding)
+            click.echo(f"Tags saved for file: {file}")
+            tagged_cache[os.path.abspath(file)] = _stat_sig(file)
+            _save_tagged_cache(tagged_cache)
+            continue
 
         # Print current tags
         pprint_tags(m4b, pause=False)
 
+        # flipped by any case below that writes a tag; the redraw after the
+        # loop is skipped when every required tag was already in place
+        dirty: bool = False
         tag: Tag
-        for tag in required_tags:
+        for tag in _REQUIRED_TAGS:
             match tag:
                 case Tag.TRACK_TITLE:
                     if title:
                         # set both track title and album
-                        m4b[Tag.TRACK_TITLE.value] = title
-                        m4b[Tag.ALBUM.value] = title
+                        m4b[_TITLE] = title
+                        m4b[_ALBUM] = title
+                        dirty = True
                     else:
                         # check both track title and album
-                        track_title: str = m4b.get(tag.value, [None])[0]  # type: ignore
-                        album_title: str = m4b.get(Tag.ALBUM.value, [None])[0]  # type: ignore
+                        track_title: str = cur[_TITLE]
+                        album_title: str = cur[_ALBUM]
 
                         if track_title:
                             if not album_title:
-                                m4b[Tag.ALBUM.value] = track_title
+                                m4b[_ALBUM] = track_title
+                                dirty = True
                             elif album_title != track_title:
                                 LOG.warning(
                                     f"Track title '{track_title}' does not match album title '{album_title}'."
@@ -172,29 +477,33 @@ def set_tags(
                                     prompt_suffix="",
                                 ):
                                     new_title: str = click.prompt("Enter new title")
-                                    m4b[Tag.ALBUM.value] = new_title
-                                    m4b[Tag.TRACK_TITLE.value] = new_title
+                                    m4b[_ALBUM] = new_title
+                                    m4b[_TITLE] = new_title
+                                    dirty = True
                         else:
                             if album_title:
-                                m4b[Tag.TRACK_TITLE.value] = album_title
+                                m4b[_TITLE] = album_title
                             else:
                                 # prompt user for track title
                                 new_title: str = click.prompt("Enter book title")
-                                m4b[Tag.TRACK_TITLE.value] = new_title
-                                m4b[Tag.ALBUM.value] = new_title
+                                m4b[_TITLE] = new_title
+                                m4b[_ALBUM] = new_title
+                            dirty = True
                 case Tag.ARTIST:
                     if author:
                         # set both artist and album artist
-                        m4b[Tag.ARTIST.value] = author
-                        m4b[Tag.ALBUM_ARTIST.value] = author
+                        m4b[_ARTIST] = author
+                        m4b[_ALBUM_ARTIST] = author
+                        dirty = True
                     else:
                         # check both artist and album artist
-                        tag_artist: str = m4b.get(tag.value, [None])[0]  # type: ignore
-                        album_artist: str = m4b.get(Tag.ALBUM_ARTIST.value, [None])[0]  # type: ignore
+                        tag_artist: str = cur[_ARTIST]
+                        album_artist: str = cur[_ALBUM_ARTIST]
 
                         if tag_artist:
                             if not album_artist:
-                                m4b[Tag.ALBUM_ARTIST.value] = tag_artist
+                                m4b[_ALBUM_ARTIST] = tag_artist
+                                dirty = True
                             elif album_artist != tag_artist:
                                 LOG.warning(
                                     f"Artist tag '{tag_artist}' does not match album artist '{album_artist}'."
@@ -206,86 +515,77 @@ def set_tags(
                                     new_artist: str = click.prompt(
                                         "Enter new Author names separated by semicolons(;)"
                                     )
-                                    m4b[Tag.ALBUM_ARTIST.value] = new_artist
-                                    m4b[Tag.ARTIST.value] = new_artist
+                                    m4b[_ALBUM_ARTIST] = new_artist
+                                    m4b[_ARTIST] = new_artist
+                                    dirty = True
                         else:
                             if album_artist:
-                                m4b[Tag.ARTIST.value] = album_artist
+                                m4b[_ARTIST] = album_artist
                             else:
                                 # prompt user for artist
                                 new_artist: str = click.prompt("Enter artist (author)")
-                                m4b[Tag.ARTIST.value] = new_artist
-                                m4b[Tag.ALBUM_ARTIST.value] = new_artist
+                                m4b[_ARTIST] = new_artist
+                                m4b[_ALBUM_ARTIST] = new_artist
+                            dirty = True
                 case Tag.COVER:
                     pass
                     # set_cover_tag(m4b=m4b)
                 case Tag.DESCRIPTION:
                     if description:
-                        set_description_tags(m4b=m4b, description=description)
+                        dirty |= set_description_tags(m4b=m4b, description=description)
                     else:
-                        set_description_tags(m4b=m4b, prompt=False)
+                        dirty |= set_description_tags(m4b=m4b, prompt=False)
                 case Tag.GENRE:
                     if genre:
-                        m4b[tag.value] = TAG_DELIMITER.join(genre)
-                    elif not m4b.get(tag.value, [None])[0]:  # type: ignore
+                        m4b[tag] = TAG_DELIMITER.join(genre)
+                        dirty = True
+                    elif not cur[_GENRE]:
                         # prompt user for genre if not set
-                        new_genres: list[str] = []
-                        while True:
-                            click.clear()
-                            click.echo("Available genres:")
-                            click.echo(
-                                [genre for genre in GENRES if genre not in new_genres]
-                            )
-
-                            # TODO Include "custom" genre option
-                            # TODO check for and exclude "Audiobook" genre in provided files
-                            new_genre: str = click.prompt(
-                                text="Enter a genre from the list, or 'enter' to continue",
-                                default="",
-                            )
-
-                            if new_genre in GENRES and new_genre not in new_genres:
-                                new_genres.append(new_genre)
-                            elif not new_genre:
-                                # break out of loop if user hits enter
-                                break
-                            else:
-                                click.echo("Invalid genre, try again.")
-                                sleep(2)
-
-                        m4b[tag.value] = TAG_DELIMITER.join(new_genres)
+                        new_genres: list[str] = _prompt_genres()
+                        m4b[tag] = TAG_DELIMITER.join(new_genres)
+                        dirty = True
                 case Tag.SERIES_NAME:
                     # get tag values
-                    tag_series_name: str = m4b.get(tag.value, [None])[0]  # type: ignore
-                    tag_series_part: str = m4b.get(Tag.SERIES_PART.value, [None])[0]  # type: ignore
+                    tag_series_name: str = cur[_SERIES_NAME]
+                    tag_series_part: str = cur[_SERIES_PART]
+
+                    # the freeform series atoms want bytes; encode each
+                    # provided value once for every branch below
+                    sn_bytes: bytes | None = (
+                        series_name.encode("utf-8") if series_name else None
+                    )
+                    sp_bytes: bytes | None = (
+                        str(series_part).encode("utf-8") if series_part else None
+                    )
 
                     if series_name and series_part:
                         # if both are provided, just set the tags.
-                        m4b[Tag.SERIES_NAME.value] = series_name.encode("utf-8")
-                        m4b[Tag.SERIES_PART.value] = str(series_part).encode("utf-8")
+                        m4b[_SERIES_NAME] = sn_bytes
+                        m4b[_SERIES_PART] = sp_bytes
+                        dirty = True
                     elif series_name or series_part:
                         # otherwise, if one is provided, check for the other
                         if series_name and not tag_series_part:
-                            new_series_part: str = click.prompt(
+                            new_series_part: float = click.prompt(
                                 text=(
                                     "Series name provided, but no existing tag value for series part number. \n"
                                     "Please enter series part number"
                                 ),
                                 type=float,
                             )
-                            m4b[Tag.SERIES_NAME.value] = series_name.encode("utf-8")
-                            m4b[Tag.SERIES_PART.value] = new_series_part.encode("utf-8")
+                            m4b[_SERIES_NAME] = sn_bytes
+                            m4b[_SERIES_PART] = str(new_series_part).encode("utf-8")
+                            dirty = True
                         elif series_part and not tag_series_name:
                             new_series_name: str = click.prompt(
                                 text=(
-                                    "Series name provided, but no existing tag value for series part number. \n"
-                                    "Please enter series part number"
+                                    "Series part provided, but no existing tag value for series name. \n"
+                                    "Please enter series name"
                                 )
                             )
-                            m4b[Tag.SERIES_NAME.value] = new_series_name.encode("utf-8")
-                            m4b[Tag.SERIES_PART.value] = str(series_part).encode(
-                                "utf-8"
-                            )
+                            m4b[_SERIES_NAME] = new_series_name.encode("utf-8")
+                            m4b[_SERIES_PART] = sp_bytes
+                            dirty = True
                         else:
                             LOG.critical(
                                 "There is a flaw in application logic. This code should never be reached. "
@@ -299,19 +599,21 @@ def set_tags(
                                 continue
                             else:
                                 # Only series name exists, get part
-                                new_series_part: str = click.prompt(
-                                    "Enter series part number", float
+                                new_series_part: float = click.prompt(
+                                    "Enter series part number", type=float
                                 )
-                                m4b[Tag.SERIES_PART.value] = new_series_part.encode(
+                                m4b[_SERIES_PART] = str(new_series_part).encode(
                                     "utf-8"
                                 )
+                                dirty = True
                         else:
                             if tag_series_part:
                                 # Only series part exists, get name
                                 new_series_name: str = click.prompt("Enter series name")
-                                m4b[Tag.SERIES_NAME.value] = new_series_name.encode(
+                                m4b[_SERIES_NAME] = new_series_name.encode(
                                     "utf-8"
                                 )
+                                dirty = True
                             else:
                                 # Neither tag exists
                                 if click.confirm(
@@ -320,159 +622,64 @@ def set_tags(
                                     new_series_name: str = click.prompt(
                                         "Enter series name"
                                     )
-                                    new_series_part: str = click.prompt(
-                                        "Enter series part number", float
+                                    new_series_part: float = click.prompt(
+                                        "Enter series part number", type=float
                                     )
-                                    m4b[Tag.SERIES_NAME.value] = new_series_name.encode(
+                                    m4b[_SERIES_NAME] = new_series_name.encode(
                                         "utf-8"
                                     )
-                                    m4b[Tag.SERIES_PART.value] = new_series_part.encode(
+                                    m4b[_SERIES_PART] = str(new_series_part).encode(
                                         "utf-8"
                                     )
+                                    dirty = True
                 case _:
-                    if not m4b.get(tag.value, [None])[0]:  # type: ignore
+                    if not cur[tag]:
                         tag_input_map: dict[Tag, str] = {
                             Tag.YEAR: date,
                             Tag.NARRATOR: narrator,
                         }
                         # check if the tag has a user provided value
                         if tag in tag_input_map and tag_input_map[tag]:
-                            m4b[tag.value] = tag_input_map[tag]
-                        elif not m4b.get(tag.value, [None])[0]:  # type: ignore
-                            # only set unset tags
+                            m4b[tag] = tag_input_map[tag]
+                        else:
+                            # the enclosing if already established the tag
+                            # is unset; prompt for it
                             value: str = click.prompt(f"Enter {tag.name}")
-                            m4b[tag.value] = value
+                            m4b[tag] = value
+                        dirty = True
 
-        # Show updated tags
-        pprint_tags(m4b, pause=False)
+        # Show updated tags; the screen already reflects the current state
+        # when nothing was written above
+        if dirty:
+            pprint_tags(m4b, pause=False)
 
-        # Prompt loop for user to change additional tags
+        # Batch any further edits into a single editor session instead of a
+        # prompt round-trip per tag.
         if click.confirm("Are there any tags you want to change?", prompt_suffix=""):
-            while True:
-                tag_to_chg: str = click.prompt(
-                    text="Enter tag name to change (e.g. 'ALBUM'), or 'enter' to continue",
-                    default="",
-                )
-                if tag_to_chg:
-                    # get tag enum
-                    try:
-                        tag_enum: Tag = Tag[tag_to_chg.upper()]
-                    except KeyError:
-                        LOG.error(f"Invalid tag: '{tag_to_chg}'")
-                        continue
-
-                    match tag_enum:
-                        case Tag.COVER:
-                            set_cover_tag(m4b=m4b)
-                        case Tag.GENRE:
-                            # prompt for genre
-                            new_genres: list[str] = []
-                            while True:
-                                click.clear()
-                                click.echo("Available genres:")
-                                click.echo(
-                                    [
-                                        genre
-                                        for genre in GENRES
-                                        if genre not in new_genres
-                                    ]
-                                )
-
-                                new_genre: str = click.prompt(
-                                    text="Enter a genre from the list, or 'enter' to continue",
-                                    default="",
-                                )
-
-                                if new_genre in GENRES and new_genre not in new_genres:
-                                    new_genres.append(new_genre)
-                                elif not new_genre:
-                                    # break out of loop if user hits enter
-                                    break
-                                else:
-                                    click.echo("Invalid genre, try again.")
-                                    sleep(2)
-
-                            m4b[tag_enum.value] = TAG_DELIMITER.join(new_genres)
-                        case e if e in [Tag.DESCRIPTION, Tag.COMMENT]:
-                            set_description_tags(m4b=m4b)
-                        case e if e in [Tag.ARTIST, Tag.ALBUM_ARTIST]:
-                            # Update both artist and album artist at the same time
-                            new_artist: str = click.prompt(
-                                text=f"Enter new Author name or 'Enter' to abort",
-                                default="",
-                            )
-                            if new_artist:
-                                m4b[Tag.ARTIST.value] = new_artist
-                                m4b[Tag.ALBUM_ARTIST.value] = new_artist
-                            else:
-                                click.prompt(
-                                    text="Aborted. Press 'enter' to continue.",
-                                    default="",
-                                )
-                        case e if e in [Tag.ALBUM, Tag.TRACK_TITLE]:
-                            # Update both album and track title at the same time
-                            new_title: str = click.prompt(
-                                text=f"Enter new Title or 'Enter' to abort",
-                                default="",
-                            )
-                            if new_title:
-                                m4b[Tag.ALBUM.value] = new_title
-                                m4b[Tag.TRACK_TITLE.value] = new_title
-                            else:
-                                click.prompt(
-                                    text="Aborted. Press 'enter' to continue.",
-                                    default="",
-                                )
-                        case _:
-                            match len(m4b.get(tag_enum.value, [])):  # type: ignore
-                                case 0:
-                                    click.echo(f"Tag '{tag_enum.name}' is empty.")
-                                case 1:
-                                    click.echo(
-                                        f"Current value for '{tag_enum.name}': {m4b[tag_enum.value][0]}"
-                                    )
-                                case _:
-                                    click.echo(f"Current values for '{tag_enum.name}':")
-                                    click.echo(m4b[tag_enum.value])
-
-                            new_tag_value = click.prompt(
-                                text=f"Enter new value for '{tag_enum.name}' or 'Enter' to abort",
-                                default="",
-                            ).strip()
-                            if new_tag_value:
-                                try:
-                                    m4b[tag_enum.value] = new_tag_value.encode("utf-8")
-                                except Exception as e:
-                                    LOG.error(
-                                        f"Error setting tag '{tag_enum.name}': {e}"
-                                    )
-                                    m4b[tag_enum.value] = new_tag_value
-                            else:
-                                click.prompt(
-                                    text="Aborted. Press 'enter' to continue.",
-                                    default="",
-                                )
-
-                else:
-                    break
-
-                # Show updated tags for user to review
+            # only re-render when the editor actually changed something; the
+            # screen otherwise still shows the state printed above
+            if edit_tags_in_editor(m4b):
                 pprint_tags(m4b, pause=False)
 
-        # Prompt to save tags to file
-        pprint_tags(m4b, pause=False)
-        if click.confirm("Do you want to save these tags?", abort=True):
-            m4b.save()
-            click.echo(f"Tags saved for file: {file}")
-
-        # TODO add option to rename to  "Author - Title.m4b"
-        cur_title: str | list[str] = m4b[Tag.TRACK_TITLE.value]
-        file_title: str = cur_title[0] if type(cur_title) == list else cur_title
-
-        cur_artist: str | list[str] = m4b[Tag.ARTIST.value]
-        file_artist: str = (
-            cur_artist[0] if type(cur_artist) == list else cur_artist.split(";")[0]
-        )
+        # Prompt to save tags to file; answering no aborts the command.
+        # The save must happen before the rename prompt: that confirm also
+        # aborts on no, and confirmed edits have to hit disk either way.
+        click.confirm("Do you want to save these tags?", abort=True)
+        m4b.save(padding=_no_new_padding)
+        click.echo(f"Tags saved for file: {file}")
+        # record the post-save signature; written immediately since the
+        # rename confirm below can abort the whole command
+        tagged_cache[os.path.abspath(file)] = _stat_sig(file)
+        _save_tagged_cache(tagged_cache)
+
+        cur_title: str | list[str] = m4b[_TITLE]
+        file_title: str = cur_title[0] if isinstance(cur_title, list) else cur_title
+
+        # mutagen returns a list for these keys; unwrap before splitting off
+        # the first author so the split never runs on a list
+        cur_artist: str | list[str] = m4b[_ARTIST]
+        artist_str: str = cur_artist[0] if isinstance(cur_artist, list) else cur_artist
+        file_artist: str = artist_str.split(";")[0]
 
         new_file: str = os.path.join(
             os.path.dirname(source),
@@ -483,25 +690,77 @@ def set_tags(
             f"Do you want to auto-rename the file ('{file}' --> '{new_file}')?",
             abort=True,
         ):
-            # Rename file as "author - title.m4b"
+            # Rename file as "author - title.m4b"; the tags were already
+            # saved above, so this is a pure move
             shutil.move(file, new_file)
+            # keep the cache keyed by the file's current location
+            tagged_cache[os.path.abspath(new_file)] = tagged_cache.pop(
+                os.path.abspath(file)
+            )
+            _save_tagged_cache(tagged_cache)
 
 
 @click.command(context_settings=COMMON_CONTEXT, name="print")
 @common_options
 def print_tags(source: str, recurse: bool):
     """Print audiobook tags to the console."""
-    files = get_file_list(source, ext="m4b", recurse=recurse)
-    for file in files:
-        m4b = MP4(file)
-        click.echo(f"Tags for file: {file}")
-        pprint_tags(m4b, pause=False)
-        click.echo(f"")
-        click.echo(f"")
+    # materialized because prefetch needs the full set before the first parse
+    files = list(get_file_list(source, ext="m4b", recurse=recurse))
+    # warm the page cache for the header atoms before parsing one by one
+    prefetch_headers(files)
+
+    def load(file: str) -> tuple[str, MP4]:
+        m4b: MP4 = open_mp4(file)
+        if m4b.tags is not None:
+            # drop the cover art so pprint doesn't format kilobytes of image
+            # bytes per file; this is a print-only command
+            m4b.tags.pop(Tag.COVER, None)
+        return file, m4b
+
+    # Parsing is read-only and I/O bound, so overlap the header reads across
+    # a thread pool; executor.map keeps results (and thus output) in order.
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4)) as executor:
+        for file, m4b in executor.map(load, files):
+            click.echo(f"Tags for file: {file}")
+            pprint_tags(m4b, pause=False)
+            click.echo(f"")
+            click.echo(f"")
 
 
 @click.command(context_settings=COMMON_CONTEXT, name="verify")
 @common_logging
 @common_options
 def verify_tags(source: str, recurse: bool):
-    """Verify required audiobook tags are set and automatically set some (e.g. title and album) if missing. (not implemented)"""
+    """Verify required audiobook tags are set. Read-only; never rewrites."""
+    # materialized because prefetch needs the full set before the first parse
+    files: list[str] = list(get_file_list(source, ext="m4b", recurse=recurse))
+    # warm the page cache for the header atoms before parsing one by one
+    prefetch_headers(files)
+    tagged_cache: dict[str, list[int]] = _load_tagged_cache()
+
+    def check(file: str) -> tuple[str, list[str]]:
+        """Return (file, missing required tag names)."""
+        if tagged_cache.get(os.path.abspath(file)) == _stat_sig(file):
+            # unchanged since it last passed; skip the parse entirely
+            return file, []
+        try:
+            m4b: MP4 = open_mp4(file)
+        except Exception as e:
+            return file, [f"unreadable: {e}"]
+        return file, [t.name for t in _REQUIRED_TAGS if not m4b.get(t)]
+
+    ok_count: int = 0
+    missing_count: int = 0
+    # Checks are read-only and I/O bound, so overlap them in a thread pool;
+    # executor.map keeps the report in input order.
+    with ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4)) as executor:
+        for file, missing in executor.map(check, files):
+            if missing:
+                missing_count += 1
+                click.echo(f"{file}: missing {', '.join(missing)}")
+            else:
+                ok_count += 1
+                tagged_cache[os.path.abspath(file)] = _stat_sig(file)
+                click.echo(f"{file}: OK")
+    _save_tagged_cache(tagged_cache)
+    click.echo(f"{ok_count} file(s) OK, {missing_count} file(s) missing tags.")
@@ -1,10 +1,13 @@
 import functools
 import logging
+import os
 
 import click
 
-from util.file import CWD
-from util.mp4 import GENRES
+
+# The decorator stacks (group, subgroup, command), so guard the handler setup
+# to run once per process; later wrappers only adjust the level.
+_logging_configured: bool = False
 
 
 # Decorator to add common options to click commands
@@ -19,76 +22,77 @@ def common_logging(f):
     )
     @functools.wraps(f)
     def log_wrapper(log_level: str, *args, **kwargs):
-        logging.basicConfig(
-            level=log_level,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            datefmt="%Y-%m-%d %H:%M:%S%Z",
-        )
+        global _logging_configured
+        if not _logging_configured:
+            logging.basicConfig(
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                datefmt="%Y-%m-%d %H:%M:%S%Z",
+            )
+            _logging_configured = True
+        logging.getLogger().setLevel(log_level)
         return f(*args, **kwargs)
 
     return log_wrapper
 
 
 def common_options(f):
-    @click.option(
-        "--source",
-        "-s",
-        default=CWD,
-        show_default=False,
-        help="Source file or directory to work on. Defaults to current directory.",
-    )
-    @click.option(
+    # The options are attached to f directly; a pass-through wrapper would
+    # only add a call frame per invocation.
+    f = click.option(
         "--recurse/--no-recurse",
         default=False,
         show_default=True,
         help="Recursively process subdirectories.",
-    )
-    @functools.wraps(f)
-    def common_wrapper(*args, **kwargs):
-        return f(*args, **kwargs)
-
-    return common_wrapper
+    )(f)
+    f = click.option(
+        "--source",
+        "-s",
+        default=lambda: os.getcwd(),
+        show_default=False,
+        help="Source file or directory to work on. Defaults to current directory.",
+    )(f)
+    return f
 
 
 # decorator to add common tags as options to click commands
 def common_tag_options(f):
-    @click.option(
-        "--author",
-        help="Author of the audiobook.",
-    )
-    @click.option(
-        "--title",
-        help="Title of the audiobook.",
-    )
-    @click.option(
-        "--date",
-        help="Publish date of the audiobook. Usually just the year.",
-    )
-    @click.option(
+    # Imported here rather than at module scope so commands that don't take
+    # tag options never pull in mutagen via util.mp4.
+    from util.mp4 import GENRES
+
+    f = click.option(
+        "--series-part",
+        help="Part number of the series the audiobook belongs to. Number only. Decimals are allowed.",
+        type=float,
+    )(f)
+    f = click.option(
+        "--series-name",
+        help="Series name the audiobook belongs to.",
+    )(f)
+    f = click.option(
+        "--narrator",
+        help="Narrator of the audiobook.",
+    )(f)
+    f = click.option(
+        "--description",
+        help="Description of the audiobook.",
+    )(f)
+    f = click.option(
         "--genre",
         help="Genre of the audiobook.",
         multiple=True,
         type=click.Choice(GENRES),
-    )
-    @click.option(
-        "--description",
-        help="Description of the audiobook.",
-    )
-    @click.option(
-        "--narrator",
-        help="Narrator of the audiobook.",
-    )
-    @click.option(
-        "--series-name",
-        help="Series name the audiobook belongs to.",
-    )
-    @click.option(
-        "--series-part",
-        help="Part number of the series the audiobook belongs to. Number only. Decimals are allowed.",
-        type=float,
-    )
-    @functools.wraps(f)
-    def tag_wrapper(*args, **kwargs):
-        return f(*args, **kwargs)
-
-    return tag_wrapper
+    )(f)
+    f = click.option(
+        "--date",
+        help="Publish date of the audiobook. Usually just the year.",
+    )(f)
+    f = click.option(
+        "--title",
+        help="Title of the audiobook.",
+    )(f)
+    f = click.option(
+        "--author",
+        help="Author of the audiobook.",
+    )(f)
+    return f
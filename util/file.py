@@ -1,45 +1,109 @@
 import os
+from collections.abc import Iterator
+
 from util.constants import SHITTY_REJECT_CHARACTERS_WE_HATES
 
-CWD: str = os.getcwd()
+# Deletion table for filter_path_name, built once so each call is a single
+# C-level translate instead of a per-character Python loop.
+_REJECT_TABLE: dict[int, None] = str.maketrans(
+    "", "", "".join(SHITTY_REJECT_CHARACTERS_WE_HATES)
+)
+
+
+def _scan_for_files(path: str, suffix: str, exclude_dir: str = "") -> Iterator[str]:
+    """
+    Recursively yield files ending in suffix using os.scandir.
+
+    scandir reuses the file-type info the OS already returned with each
+    directory entry, avoiding the extra stat call per entry that a naive
+    walk would make.
+
+    :param exclude_dir: Absolute path of a directory to skip entirely.
+    """
+    subdirs: list[str] = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                # no audiobooks live in hidden dirs; don't descend into them
+                if entry.name.startswith("."):
+                    continue
+                if exclude_dir and os.path.abspath(entry.path) == exclude_dir:
+                    continue
+                subdirs.append(entry.path)
+            elif entry.name.endswith(suffix) and entry.is_file(follow_symlinks=False):
+                yield entry.path
+    for subdir in subdirs:
+        yield from _scan_for_files(subdir, suffix, exclude_dir)
+
 
 def filter_path_name(path: str) -> str:
-    return "".join([c for c in path if c not in SHITTY_REJECT_CHARACTERS_WE_HATES])
+    return path.translate(_REJECT_TABLE)
 
-def get_file_list(path: str, ext: str = "", recurse: bool = False) -> list[str]:
+def get_file_list(
+    path: str, ext: str = "", recurse: bool = False, exclude_dir: str = ""
+) -> Iterator[str]:
     """
-    Compile an appropriate list of files based on the path provided.
+    Yield an appropriate stream of files based on the path provided.
+
+    Streaming instead of materializing a list lets callers start working on
+    the first file while the rest of the tree is still being scanned. Wrap
+    in list() when the full set is needed up front.
 
     :param path: The path to the file or directory to search.
     :param ext: The file extension to search for. Ignored if path is a file.
     :param recurse: Whether or not to recurse through subdirectories. Ignored if path
         is a file.
+    :param exclude_dir: Absolute path of a subdirectory to skip when recursing.
     """
-    file_list: list[str] = []
-
     # determine if path is a file or directory
     if os.path.isfile(path):
-        # Path is a file, so just add it to the list and move on
-        file_list.append(path)
+        # Path is a file, so just yield it and move on
+        yield path
     elif os.path.isdir(path):
         if not ext:
             # No extension provided, so we can't search for files
             raise ValueError("No extension provided, so we can't search for files.")
         # Path is a directory, so we need to search for files
+        suffix: str = f".{ext}"
         if recurse:
-            for root, _, files in os.walk(path):
-                for file in files:
-                    if file.endswith(f".{ext}"):
-                        file_list.append(os.path.join(root, file))
+            yield from _scan_for_files(path, suffix, exclude_dir)
         else:
-            # Just get the files in the current directory
-            for file in os.listdir(path):
-                if os.path.isfile(file) and file.endswith(f".{ext}"):
-                    file_list.append(os.path.join(path, file))
+            # Just get the files in the current directory; scandir reuses the
+            # file-type info from the directory entry, so no per-file stat
+            with os.scandir(path) as entries:
+                for entry in entries:
+                    if entry.name.endswith(suffix) and entry.is_file(
+                        follow_symlinks=False
+                    ):
+                        yield entry.path
     else:
         raise FileNotFoundError(f"Path '{path}' not found.")
 
-    return file_list
+
+def prefetch_headers(files: list[str], length: int = 64 * 1024) -> None:
+    """
+    Hint the OS to read ahead the leading bytes of each file.
+
+    Tag parsing only touches the header atoms, so warming the page cache for
+    the first chunk of every file lets the kernel overlap those reads instead
+    of faulting them in one file at a time. A no-op on platforms without
+    posix_fadvise (e.g. Windows).
+
+    :param files: Paths whose headers should be prefetched.
+    :param length: Number of leading bytes to request per file.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for file in files:
+        try:
+            fd: int = os.open(file, os.O_RDONLY)
+            try:
+                os.posix_fadvise(fd, 0, length, os.POSIX_FADV_WILLNEED)
+            finally:
+                os.close(fd)
+        except OSError:
+            # Prefetch is best-effort; the real read will surface any error
+            continue
 
 
 def get_dirs_from_files(files: list[str]) -> list[str]:
@@ -48,9 +112,6 @@ def get_dirs_from_files(files: list[str]) -> list[str]:
 
     :param files: A list of files to get the directories from.
     """
-    dirs: list[str] = []
-    for file in files:
-        dirname: str = os.path.dirname(file)
-        if dirname not in dirs:
-            dirs.append(dirname)
-    return dirs
+    # dict.fromkeys dedupes through a hash table while keeping first-seen
+    # order, instead of an O(n) list scan per file
+    return list(dict.fromkeys(os.path.dirname(file) for file in files))
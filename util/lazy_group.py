@@ -0,0 +1,39 @@
+"""Lazy-loading click group to keep CLI startup fast."""
+
+import importlib
+
+import click
+
+
+class LazyGroup(click.Group):
+    """
+    Click group that defers importing subcommand modules until the
+    subcommand is actually invoked (or listed for help output).
+
+    Based on the lazy loading pattern from the click docs. Subcommands are
+    declared as a mapping of command name to "module:attribute" strings, so
+    running one command never pays the import cost of its siblings.
+    """
+
+    def __init__(self, *args, lazy_subcommands: dict[str, str] | None = None, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = lazy_subcommands or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted(super().list_commands(ctx) + list(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._lazy_load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _lazy_load(self, cmd_name: str) -> click.Command:
+        import_path: str = self.lazy_subcommands[cmd_name]
+        module_name, attr_name = import_path.rsplit(":", 1)
+        module = importlib.import_module(module_name)
+        command = getattr(module, attr_name)
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of '{import_path}' failed: not a click command."
+            )
+        return command
@@ -4,7 +4,7 @@ import enum
 import click
 from mutagen.mp4 import MP4
 
-GENRES = [
+GENRES = (
     "Apocalyptic & Dystopian",
     "Art",
     "Biography & Memoir",
@@ -54,12 +54,20 @@ GENRES = [
     "Westerns",
     "YA Fiction",
     "YA Nonfiction",
-]
+)
+
+# For O(1) membership tests; GENRES stays an ordered tuple for display.
+GENRES_SET: frozenset[str] = frozenset(GENRES)
+
+# casefolded form -> canonical spelling, for case-insensitive entry
+GENRES_BY_FOLD: dict[str, str] = {g.casefold(): g for g in GENRES}
 
 
 # Enum to map human readable tag names to mp4 tag names.
 # Mostly stolen from Mutagen's docs
-class Tag(enum.Enum):
+# StrEnum members are the atom-key strings themselves, so they index
+# mutagen mappings directly without the .value descriptor hop.
+class Tag(enum.StrEnum):
     ALBUM = "\xa9alb"
     ALBUM_ARTIST = "aART"
     ARTIST = "\xa9ART"
@@ -76,23 +84,71 @@ class Tag(enum.Enum):
 
     @classmethod
     def print_all(cls) -> None:
-        for tag in cls:
-            click.echo(f"{tag.name}: {tag.value}")
-        click.echo("")
+        click.echo(_LEGEND)
+
+    @classmethod
+    def from_name(cls, name: str) -> "Tag | None":
+        """Look up a member by human-readable name; None if unknown."""
+        return _BY_NAME.get(name)
+
+    @classmethod
+    def from_value(cls, value: str) -> "Tag | None":
+        """Look up a member by mp4 atom key; None if unknown."""
+        return _BY_VALUE.get(value)
+
+
+# The enum is immutable, so the legend print_all emits is rendered once at
+# import instead of one echo per member per call.
+_LEGEND: str = "\n".join(f"{t.name}: {t.value}" for t in Tag) + "\n"
+
+# Reverse lookups built once; from_name/from_value are single dict probes
+# instead of a linear scan over the members.
+_BY_NAME: dict[str, Tag] = {t.name: t for t in Tag}
+_BY_VALUE: dict[str, Tag] = {t.value: t for t in Tag}
+
+
+def open_mp4(path: str) -> MP4:
+    """
+    Parse an m4b through a large read buffer.
+
+    A plain MP4(path) opens with the filesystem's block size, which on
+    network mounts turns the header parse into many small reads; a 64KB
+    buffer pulls the leading atoms in a couple of syscalls. The handle is
+    closed as soon as the parse finishes; saves re-open by path.
+    """
+    with open(path, "rb", buffering=1 << 16) as fh:
+        m4b: MP4 = MP4(fileobj=fh)
+    # record the path the way MP4(path) would, so save() and display work
+    m4b.filename = path
+    return m4b
+
+
+# The last rendered screen; when a redraw is requested with identical
+# content the terminal already shows it, so the clear + write is skipped.
+_last_render: str | None = None
 
 
 # function to print current tags
 def pprint_tags(file: MP4, pause: bool = True) -> None:
-    click.clear()
-    click.echo(f"Tags for file: {file.filename}")
-    click.echo("Current tags:")
-    click.echo("-------------")
-    click.echo(file.tags.pprint())  # type: ignore
-    click.echo("")
-    click.echo("Legend:")
-    Tag.print_all()
+    global _last_render
+    body: str = "\n".join(
+        (
+            f"Tags for file: {file.filename}",
+            "Current tags:",
+            "-------------",
+            file.tags.pprint(),  # type: ignore
+            "",
+            "Legend:",
+            _LEGEND,
+        )
+    )
+    if body != _last_render:
+        click.clear()
+        click.echo(body)
+        _last_render = body
     if pause:
-        click.echo("Press 'enter' to continue.")
-        click.prompt("")
+        # a raw single-character read instead of the full prompt machinery
+        click.echo("Press any key to continue.")
+        click.getchar()
     else:
         click.echo("")
@@ -0,0 +1,16 @@
+"""Cached regex compilation for dynamically-built patterns."""
+
+import re
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def compile_re(pattern: str, flags: int = 0) -> re.Pattern:
+    """
+    Compile a regex, caching the result.
+
+    Static patterns should be compiled at module scope; this is for patterns
+    built inside function bodies (or, eventually, user-supplied ones), where
+    a dedicated LRU beats relying on the re module's global cache.
+    """
+    return re.compile(pattern, flags)